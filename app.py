@@ -1,20 +1,54 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import csv
 import json
+import io
+import mmap
 import time
-import plotly.graph_objects as go
-import plotly.express as px
 import pathlib
 from datetime import datetime, timedelta
 import subprocess
+import signal
 import os
 import sys
+import threading
+import importlib.util
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+
+# Optional fast CSV reader; only looked up here, imported on first use (~140 ms)
+HAS_POLARS = importlib.util.find_spec("polars") is not None
+
+try:
+    import orjson  # Faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
+try:
+    from streamlit_autorefresh import st_autorefresh  # Browser-driven reruns
+except ImportError:
+    st_autorefresh = None
+
+try:
+    import psutil  # Process command lines where there is no /proc (macOS, Windows)
+except ImportError:
+    psutil = None
+
+try:
+    from watchdog.observers import Observer  # File change notifications (ships with streamlit)
+except ImportError:
+    Observer = None
+
+# Wall-clock time of this rerun; everything below that shows or stamps "now" uses it
+rerun_time = datetime.now()
 
 # --- Initialize Session State for the bot process ---
 if 'bot_process' not in st.session_state:
     st.session_state.bot_process = None
-if 'last_refresh' not in st.session_state:
-    st.session_state.last_refresh = datetime.now()
+# Bookkeeping for the sidebar/debug captions, done up front so they describe this very run
+st.session_state.last_refresh = rerun_time
+st.session_state.refresh_count = st.session_state.get('refresh_count', 0) + 1
 
 # --- Page and File Setup ---
 st.set_page_config(
@@ -38,67 +72,432 @@ else:  # Linux/Mac
         PYTHON_EXECUTABLE = sys.executable  # Use current Python
 
 BOT_SCRIPT_PATH = BASE_DIR / "crypto_com_momo_bot.py"
+BOT_COMMAND = [str(PYTHON_EXECUTABLE), str(BOT_SCRIPT_PATH)]
+# How long a successful poll() of the bot process is trusted before polling again
+BOT_POLL_TTL_SEC = 5
+# Records the running bot's PID so other sessions and a restarted dashboard find it
+BOT_PID_FILE = BASE_DIR / "bot.pid"
 
 # File paths
 TRADES_CSV = BASE_DIR / "trades.csv"
 CONFIG_JSON = BASE_DIR / "config.json"
 LIVE_DATA_JSON = BASE_DIR / "live_data.json"
 AI_STATUS_JSON = BASE_DIR / "ai_status.json"
+BOT_LOG = BASE_DIR / "bot.log"
+
+# How long a rerun waits for the background trades refresh before showing the previous snapshot
+TRADES_REFRESH_WAIT_SEC = 0.25
+
+# Adaptive auto-refresh: how many live_data.json update gaps are remembered, the fastest
+# allowed refresh, and the quantiles of those gaps at which refreshes are placed
+LIVE_UPDATE_HISTORY = 50
+MIN_REFRESH_INTERVAL_SEC = 1.0
+_REFRESH_QUANTILES = np.array([0.1, 0.25, 0.5, 0.75, 0.9, 0.99])
+
+# How much of live_data.json System Info shows; highlighting a large dump dominates the render
+LIVE_DATA_PREVIEW_CHARS = 4096
+
+# Most recent live price points considered, and how many of them are drawn
+# (long series are downsampled to MAX_CHART_POINTS, keeping their shape)
+MAX_PRICE_HISTORY = 5000
+MAX_CHART_POINTS = 500
+# Index x-axis for price series without timestamps, sliced instead of rebuilt each rerun
+_X_AXIS = np.arange(MAX_PRICE_HISTORY)
 
 # --- Helper Functions ---
-def read_trades_df():
-    """Reads and cleans the historical trades.csv file."""
-    cols = ["ts_iso", "symbol", "action", "side", "price", "qty", "reason", "pnl_usdt"]
+TRADES_COLS = ["ts_iso", "symbol", "action", "side", "price", "qty", "reason", "pnl_usdt"]
+# Legacy header names the bot has used over time
+TRADES_COL_ALIASES = {"ts": "ts_iso", "timestamp": "ts_iso", "pnl": "pnl_usdt", "amount": "qty"}
+# Low-cardinality text columns: categorical codes make the == "EXIT" style filters integer scans
+TRADES_CATEGORY_COLS = ["symbol", "action", "side", "reason"]
+# P&L is only shown to the cent, so float32 is plenty; price/qty keep float64
+# because crypto prices and sizes need more than float32's ~7 significant digits
+TRADES_NUMERIC_DTYPES = {"price": "float64", "qty": "float64", "pnl_usdt": "float32"}
+TRADES_DTYPES = {**{c: "category" for c in TRADES_CATEGORY_COLS}, **TRADES_NUMERIC_DTYPES}
+EXITS_COLS = ["ts_iso", "pnl_usdt", "cumulative_pnl"]
+
+def _file_key(path):
+    """Returns (mtime_ns, size) of a file for use as a cache key, or None if it is missing.
+
+    Integer nanoseconds keep two writes within the same float-rounded mtime apart.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def _trades_header_map(buffer):
+    """Maps the trades.csv header columns to read onto their TRADES_COLS names."""
+    header = next(csv.reader([buffer.readline().decode("utf-8-sig")]), [])
+    buffer.seek(0)
+    
+    # Canonical names win over legacy aliases for the same column
+    rename = {c: c for c in header if c in TRADES_COLS}
+    for alias, target in TRADES_COL_ALIASES.items():
+        if alias in header and target not in rename.values():
+            rename[alias] = target
+    return rename
+
+def _read_csv_polars(buffer, usecols):
+    """Reads trades.csv with polars' multithreaded parser and hands it over to pandas."""
+    import polars as pl
     
-    if not TRADES_CSV.exists() or TRADES_CSV.stat().st_size == 0:
-        return pd.DataFrame(columns=cols)
+    return pl.read_csv(buffer, columns=usecols, ignore_errors=True, try_parse_dates=True).to_pandas()
+
+def _parse_trades_csv(buffer, fast_io=True):
+    """Parses and cleans a binary buffer of trades.csv (header line included) written by the bot."""
+    rename = _trades_header_map(buffer)
+    usecols = list(rename)
+    raw_names = {target: raw for raw, target in rename.items()}
     
+    df = None
+    if fast_io and HAS_POLARS:
+        try:
+            df = _read_csv_polars(buffer, usecols)
+        except Exception:
+            df = None  # e.g. ragged rows: let pandas skip them below
+            buffer.seek(0)
+    
+    if df is None:
+        # Types and timestamps are applied by the C parser in the same pass, keyed by raw header names
+        dtype = {raw_names[c]: t for c, t in TRADES_DTYPES.items() if c in raw_names}
+        read_kwargs = dict(
+            engine="c",
+            on_bad_lines="skip",
+            usecols=usecols,
+            parse_dates=[raw_names["ts_iso"]] if "ts_iso" in raw_names else False,
+            date_format="ISO8601"
+        )
+        try:
+            df = pd.read_csv(buffer, dtype=dtype, **read_kwargs)
+        except (ValueError, TypeError):
+            # A malformed number somewhere: keep only the categorical dtypes and coerce below
+            buffer.seek(0)
+            dtype = {c: t for c, t in dtype.items() if t == "category"}
+            df = pd.read_csv(buffer, dtype=dtype, **read_kwargs)
+    
+    # One rename + reindex handles the column name variations and adds any missing columns
+    df = df.rename(columns=rename).reindex(columns=TRADES_COLS)
+    
+    # Coerce whatever the parser could not type (malformed values, missing columns, polars output)
+    for c, dtype in TRADES_NUMERIC_DTYPES.items():
+        if df[c].dtype != dtype:
+            df[c] = pd.to_numeric(df[c], errors="coerce").astype(dtype)
+    
+    if not pd.api.types.is_datetime64_any_dtype(df["ts_iso"]):
+        df["ts_iso"] = pd.to_datetime(df["ts_iso"], errors="coerce")
+    for c in TRADES_CATEGORY_COLS:
+        if df[c].dtype != "category":
+            df[c] = df[c].astype("category")
+    # Unparseable timestamps go first so the newest trades are always the tail
+    df = df.sort_values("ts_iso", ascending=True, na_position="first").reset_index(drop=True)
+    
+    return df
+
+def _read_trades_full(path_str, mtime_ns, size, fast_io=True):
+    """Loads the whole trade history as of the file state (mtime_ns, size).
+
+    Returns (df, offset) where offset is the byte position after the last complete row,
+    i.e. where the loader resumes once the bot appends more trades.
+    The cleaned frame is snapshotted to trades.parquet tagged with the CSV's (mtime_ns, size),
+    so a dashboard restart can skip the CSV parse until the bot appends another trade.
+    """
+    parquet_path = pathlib.Path(path_str).with_suffix(".parquet")
     try:
-        df = pd.read_csv(TRADES_CSV, engine="python", on_bad_lines="skip")
-        
-        # Handle column name variations
-        df = df.rename(columns={
-            "ts": "ts_iso", 
-            "timestamp": "ts_iso", 
-            "pnl": "pnl_usdt", 
-            "amount": "qty"
-        })
-        
-        # Ensure all required columns exist
-        for c in cols:
-            if c not in df.columns: 
-                df[c] = pd.NA
+        df = pd.read_parquet(parquet_path, columns=TRADES_COLS)
+        source_key = df.attrs.pop("source_key", None)
+        if source_key is not None and source_key[:2] == [mtime_ns, size]:
+            return df, source_key[2]
+    except Exception:
+        pass  # Missing, stale or unreadable snapshot: rebuild it from the CSV
+    
+    # Memory-map the file so the parser reads straight from the page cache
+    with open(path_str, "rb") as f:
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+            # A row the bot is still writing is left for the next tail read
+            offset = mm.rfind(b"\n") + 1
+        if offset == 0:
+            return pd.DataFrame(columns=TRADES_COLS), 0
         
-        # Convert data types
-        for c in ["price", "qty", "pnl_usdt"]:
-            df[c] = pd.to_numeric(df[c], errors="coerce")
+        with mmap.mmap(f.fileno(), offset, access=mmap.ACCESS_READ) as mm:
+            df = _parse_trades_csv(mm, fast_io)
+    try:
+        df.attrs["source_key"] = [mtime_ns, size, offset]
+        df.to_parquet(parquet_path, compression="snappy", index=False)
+    except Exception:
+        pass  # The snapshot is only an optimization (e.g. pyarrow not installed)
+    finally:
+        df.attrs.pop("source_key", None)
+    return df, offset
+
+def _read_trades_tail(df, offset, fast_io=True):
+    """Parses only the rows appended after byte offset and appends them to df.
+
+    Returns (df, offset, resorted); resorted is True when the new rows were out of order.
+    """
+    with open(TRADES_CSV, "rb") as f:
+        header = f.readline()
+        f.seek(offset)
+        tail = f.read()
+    
+    end = tail.rfind(b"\n") + 1
+    if end == 0:
+        return df, offset, False
+    
+    new_rows = _parse_trades_csv(io.BytesIO(header + tail[:end]), fast_io)
+    new_ts = new_rows["ts_iso"]
+    # Appended rows are normally newer than everything cached, so a re-sort is rarely needed
+    needs_sort = not df.empty and not new_rows.empty and (new_ts.isna().any() or new_ts.iloc[0] < df["ts_iso"].iloc[-1])
+    df = pd.concat([df, new_rows], ignore_index=True)
+    # concat falls back to object dtype when the category sets differ
+    for c in TRADES_CATEGORY_COLS:
+        if df[c].dtype != "category":
+            df[c] = df[c].astype("category")
+    if needs_sort:
+        df = df.sort_values("ts_iso", ascending=True, kind="stable", na_position="first").reset_index(drop=True)
+    return df, offset + end, needs_sort
+
+def _empty_trades_snapshot():
+    """The loader snapshot for an empty or missing trades.csv."""
+    return pd.DataFrame(columns=TRADES_COLS), pd.DataFrame(columns=EXITS_COLS), pd.Series(dtype="int64")
+
+def _count_actions(rows):
+    """Number of rows per action (ENTER/EXIT/...)."""
+    return rows["action"].value_counts()
+
+def _extend_exits(exits, rows):
+    """Appends the EXIT rows of rows to exits, continuing its running cumulative P&L."""
+    new_exits = rows.loc[(rows["action"] == "EXIT").to_numpy(), ["ts_iso", "pnl_usdt"]].reset_index(drop=True)
+    start = exits["cumulative_pnl"].iloc[-1] if not exits.empty else 0.0
+    new_exits["cumulative_pnl"] = start + np.nancumsum(new_exits["pnl_usdt"].to_numpy(), dtype="float64")
+    if exits.empty:
+        return new_exits
+    return pd.concat([exits, new_exits], ignore_index=True)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _load_json_cached(path_str, mtime_ns, size):
+    """Parses a JSON file. mtime_ns/size only key the cache so reruns skip unchanged files.
+
+    Every rewrite of a file is a new key, so only the most recent few parses are kept.
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers' handlers still apply
+        with open(path_str, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path_str, "r") as f:
+        return json.load(f)
+
+class _TradesLoader:
+    """Keeps the parsed trade history fresh on a single background thread.
+
+    Shared by every session through st.cache_resource: reruns only pick up the
+    latest snapshot, while parsing (full load or appended tail) runs off the
+    script thread.
+    """
+    
+    def __init__(self, fast_io):
+        self.fast_io = fast_io
+        # (trades, exits, action_counts): exits holds the EXIT rows with a precomputed
+        # cumulative P&L, action_counts the number of rows per action
+        self.snapshot = _empty_trades_snapshot()
+        self.error = None
+        self._key = None
+        self._inode = None
+        self._offset = 0
+        self._loaded = False
+        self._pending = None
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trades-loader")
+    
+    def _refresh(self):
+        try:
+            stat = TRADES_CSV.stat()
+            key, inode = (stat.st_mtime_ns, stat.st_size), stat.st_ino
+        except FileNotFoundError:
+            key, inode = None, None
+        if key == self._key and self._loaded:
+            return
         
-        df["ts_iso"] = pd.to_datetime(df["ts_iso"], errors="coerce")
-        df = df.sort_values("ts_iso", ascending=True).reset_index(drop=True)
+        old_df, exits, action_counts = self.snapshot
+        if key is None or key[1] == 0:
+            df, exits, action_counts = _empty_trades_snapshot()
+            offset = 0
+        # trades.csv is append-only, so only the new tail needs parsing unless
+        # the file shrank or was replaced (rotated) by a different file
+        elif not self._loaded or inode != self._inode or not 0 < self._offset <= key[1]:
+            df, offset = _read_trades_full(str(TRADES_CSV), *key, fast_io=self.fast_io)
+            exits = _extend_exits(pd.DataFrame(columns=EXITS_COLS), df)
+            action_counts = _count_actions(df)
+        else:
+            df, offset, resorted = _read_trades_tail(old_df, self._offset, self.fast_io)
+            new_rows = df.iloc[len(old_df):]
+            if resorted:
+                exits = _extend_exits(pd.DataFrame(columns=EXITS_COLS), df)
+                action_counts = _count_actions(df)
+            else:
+                # Only the appended exits need their running total computed
+                exits = _extend_exits(exits, new_rows)
+                action_counts = action_counts.add(_count_actions(new_rows), fill_value=0)
         
-        return df[cols]
+        self._key, self._inode, self._offset = key, inode, offset
+        self.snapshot = (df, exits, action_counts)
     
-    except Exception as e:
-        st.error(f"Error reading trades file: {e}")
-        return pd.DataFrame(columns=cols)
+    def _run(self):
+        try:
+            self._refresh()
+            self.error = None
+        except Exception as e:
+            self.error = e
+        self._loaded = True
+    
+    def latest(self, max_wait=TRADES_REFRESH_WAIT_SEC):
+        """Schedules a refresh and returns the newest snapshot available after at most max_wait seconds."""
+        with self._lock:
+            if self._pending is None or self._pending.done():
+                self._pending = self._executor.submit(self._run)
+            pending = self._pending
+        # The very first load is awaited so the page never starts out empty
+        wait_futures([pending], timeout=None if not self._loaded else max_wait)
+        return self.snapshot, self.error
+
+@st.cache_resource(show_spinner=False)
+def _trades_loader(fast_io=True):
+    """Process-wide trades loader, one per fast_io setting."""
+    return _TradesLoader(fast_io)
+
+def read_trades_df(fast_io=True):
+    """Returns the latest (trades_df, exits_df, action_counts) snapshot of trades.csv from the background loader.
+
+    exits_df holds the EXIT rows' ts_iso/pnl_usdt plus their cumulative_pnl;
+    action_counts is a Series of row counts indexed by action.
+    With fast_io the CSV is parsed by polars when it is installed.
+    """
+    snapshot, error = _trades_loader(fast_io).latest()
+    if error is not None:
+        st.error(f"Error reading trades file: {error}")
+        return _empty_trades_snapshot()
+    return snapshot
+
+WATCHED_FILES = (TRADES_CSV, LIVE_DATA_JSON, AI_STATUS_JSON)
+
+@st.cache_data(ttl=5, show_spinner=False)
+def file_status():
+    """Which of the dashboard's files exist, re-checked at most every 5 seconds."""
+    return {
+        "Bot Script": BOT_SCRIPT_PATH.exists(),
+        "Config File": CONFIG_JSON.exists(),
+        "Trades CSV": TRADES_CSV.exists(),
+        "Live Data": LIVE_DATA_JSON.exists(),
+        "AI Status": AI_STATUS_JSON.exists(),
+        "Bot Log": BOT_LOG.exists()
+    }
+
+def _watched_file_keys():
+    """File keys of everything the bot writes, used to skip auto-refreshes when nothing changed."""
+    return tuple(_file_key(p) for p in WATCHED_FILES)
+
+class _FileWatcher:
+    """watchdog event handler that counts writes to the files the bot produces.
+
+    Checking for changes is then a single integer compare instead of a stat() per file.
+    """
+    
+    # Opens/reads (including the dashboard's own) must not count as changes
+    CHANGE_EVENTS = {"modified", "created", "moved", "deleted", "closed"}
+    
+    def __init__(self, paths):
+        self.paths = {os.path.abspath(p) for p in paths}
+        self.version = 0
+    
+    def dispatch(self, event):
+        if event.event_type not in self.CHANGE_EVENTS:
+            return
+        # Atomic writes show up as the .tmp file being moved onto the target
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if os.path.abspath(path) in self.paths:
+                self.version += 1
+                return
+
+@st.cache_resource(show_spinner=False)
+def _file_watcher():
+    """Process-wide watcher of the bot's output files, or None when watchdog is unavailable."""
+    if Observer is None:
+        return None
+    watcher = _FileWatcher(WATCHED_FILES)
+    try:
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(watcher, str(BASE_DIR), recursive=False)
+        observer.start()
+    except Exception:
+        return None  # e.g. out of inotify watches: fall back to polling
+    watcher.observer = observer
+    return watcher
+
+def _change_token(watcher):
+    """Something that changes whenever one of the watched files does."""
+    return watcher.version if watcher is not None else _watched_file_keys()
+
+def next_refresh_interval(max_interval):
+    """Picks the next auto-refresh delay from how often the bot has been updating live_data.json.
+
+    Refreshes are placed at quantiles of the observed gaps between updates, so one lands
+    soon after the next update is likely; once the bot has been quiet for longer than
+    usual the delay backs off exponentially. max_interval (the slider) is the ceiling.
+    """
+    key = _file_key(LIVE_DATA_JSON)
+    if key is None:
+        return max_interval
+    mtime_ns = key[0]
+    
+    if 'update_intervals' not in st.session_state:
+        st.session_state.update_intervals = deque(maxlen=LIVE_UPDATE_HISTORY)
+        st.session_state.last_live_mtime_ns = None
+        st.session_state.stale_polls = 0
+    intervals = st.session_state.update_intervals
+    last_mtime_ns = st.session_state.last_live_mtime_ns
+    if mtime_ns != last_mtime_ns:
+        if last_mtime_ns is not None:
+            intervals.append((mtime_ns - last_mtime_ns) / 1e9)
+        st.session_state.last_live_mtime_ns = mtime_ns
+        st.session_state.stale_polls = 0
+    else:
+        st.session_state.stale_polls += 1
+    
+    if len(intervals) < 2:
+        return max_interval
+    age = time.time() - mtime_ns / 1e9
+    quantiles = np.quantile(np.fromiter(intervals, dtype=float), _REFRESH_QUANTILES)
+    upcoming = quantiles[quantiles > age]
+    if upcoming.size:
+        delay = upcoming[0] - age
+    else:
+        delay = MIN_REFRESH_INTERVAL_SEC * 2 ** min(st.session_state.stale_polls, 10)
+    return float(min(max(delay, MIN_REFRESH_INTERVAL_SEC), max_interval))
 
 def load_live_data():
-    """Load live market data with error handling - NO CACHING."""
+    """Load live market data with error handling (re-parsed only when the file changes)."""
     try:
-        if LIVE_DATA_JSON.exists():
-            # Force read the file every time
-            with open(LIVE_DATA_JSON, "r") as f:
-                data = json.load(f)
+        key = _file_key(LIVE_DATA_JSON)
+        if key is not None:
+            data = _load_json_cached(str(LIVE_DATA_JSON), *key)
             
             # Debug: Show what data structure we're getting
             if st.sidebar.checkbox("Debug Live Data", key="debug_live"):
                 st.sidebar.write("Live data structure:")
                 st.sidebar.json(data)
-                st.sidebar.write(f"File size: {LIVE_DATA_JSON.stat().st_size} bytes")
-                st.sidebar.write(f"Last modified: {datetime.fromtimestamp(LIVE_DATA_JSON.stat().st_mtime)}")
+                st.sidebar.write(f"File size: {key[1]} bytes")
+                st.sidebar.write(f"Last modified: {datetime.fromtimestamp(key[0] / 1e9)}")
             
+            st.session_state.live_data_last_good = data
             return data
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except json.JSONDecodeError as e:
+        # Most likely caught mid-write by an older bot: keep showing the last good data
+        if st.session_state.get("live_data_last_good") is not None:
+            return st.session_state.live_data_last_good
+        st.warning(f"Could not load live data: {e}")
+    except FileNotFoundError as e:
         st.warning(f"Could not load live data: {e}")
     except Exception as e:
         st.error(f"Unexpected error loading live data: {e}")
@@ -107,10 +506,10 @@ def load_live_data():
 
 def load_ai_status():
     """Load AI sentiment/status data."""
-    if AI_STATUS_JSON.exists():
+    key = _file_key(AI_STATUS_JSON)
+    if key is not None:
         try:
-            with open(AI_STATUS_JSON, "r") as f:
-                return json.load(f)
+            return _load_json_cached(str(AI_STATUS_JSON), *key)
         except (FileNotFoundError, json.JSONDecodeError):
             pass
     return None
@@ -118,34 +517,164 @@ def load_ai_status():
 def load_config():
     """Load bot configuration."""
     try:
-        if CONFIG_JSON.exists():
-            with open(CONFIG_JSON, "r") as f:
-                return json.load(f)
+        key = _file_key(CONFIG_JSON)
+        if key is not None:
+            return _load_json_cached(str(CONFIG_JSON), *key)
     except (FileNotFoundError, json.JSONDecodeError):
         pass
     return {}
 
+def _dumps_json(data):
+    """Serializes data to indented JSON bytes; NumPy arrays and scalars are written as plain lists/numbers."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2, default=lambda o: o.tolist()).encode("utf-8")
+
+def _replace_file(path, payload):
+    """Writes payload (bytes) to path atomically: a reader sees either the old or the new file, never a partial one."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
 def save_config(config):
     """Save bot configuration."""
     try:
-        with open(CONFIG_JSON, "w") as f:
-            json.dump(config, f, indent=4)
+        _replace_file(CONFIG_JSON, _dumps_json(config))
         return True
     except Exception as e:
         st.error(f"Error saving config: {e}")
         return False
 
-def is_bot_running():
-    """Check if bot process is still running."""
-    if st.session_state.bot_process is None:
+def _pid_alive(pid):
+    """Whether a process with this PID is still running, without needing its Popen handle."""
+    if os.name == 'nt':
+        # os.kill(pid, 0) would terminate the process on Windows, so ask for its exit code instead
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            return bool(kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))) and exit_code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        # Reap it if it is an exited child of this server, or it would linger as a zombie
+        if os.waitpid(pid, os.WNOHANG)[0] == pid:
+            return False
+    except ChildProcessError:
+        pass  # Not our child (e.g. started before a dashboard restart)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
         return False
+    except PermissionError:
+        pass  # Exists but belongs to another user
+    return True
+
+def _pid_is_bot(pid):
+    """Whether pid is running the bot script, not some other process that reused the PID.
+
+    Reads the command line from /proc, or from psutil where there is no /proc. Returns None when
+    it cannot be read (no psutil, or access denied): the process may well be the bot.
+    """
+    try:
+        args = pathlib.Path(f"/proc/{pid}/cmdline").read_bytes().decode(errors="replace").split("\0")
+    except FileNotFoundError:
+        if pathlib.Path("/proc/self").exists():
+            return False  # /proc works, so the process is gone
+        if psutil is None:
+            return None
+        try:
+            args = psutil.Process(pid).cmdline()
+        except psutil.NoSuchProcess:
+            return False
+        except psutil.Error:
+            return None
+    except OSError:
+        return None
+    return str(BOT_SCRIPT_PATH) in args
+
+class _AdoptedProcess:
+    """Stands in for the Popen of a bot this session did not start, known only from the PID file."""
+    
+    def __init__(self, pid):
+        self.pid = pid
+    
+    def _is_bot(self):
+        """True/False as _pid_is_bot, or None when the live PID cannot be verified."""
+        return _pid_is_bot(self.pid) if _pid_alive(self.pid) else False
+    
+    def _send(self, sig):
+        # Re-checked right before signalling: the bot may have exited and its PID been reused
+        is_bot = self._is_bot()
+        if is_bot is None:
+            raise RuntimeError(f"cannot verify that PID {self.pid} is the bot; stop it manually")
+        if is_bot:
+            os.kill(self.pid, sig)
+    
+    def poll(self):
+        # An unverifiable PID still counts as running, so no second bot is started next to it
+        return 0 if self._is_bot() is False else None
+    
+    def terminate(self):
+        self._send(signal.SIGTERM)
+    
+    def kill(self):
+        self._send(getattr(signal, "SIGKILL", signal.SIGTERM))
+    
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._is_bot() is not False:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(BOT_COMMAND, timeout)
+            time.sleep(0.1)
+        return 0
+
+def _adopt_bot_process():
+    """Returns a handle to the bot recorded in the PID file if it may still be running, else None."""
+    try:
+        pid = int(BOT_PID_FILE.read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+    process = _AdoptedProcess(pid)
+    if process.poll() is None:
+        return process
+    # Gone, or the PID now belongs to an unrelated process (e.g. after a crash or reboot)
+    _clear_pid_file(pid)
+    return None
+
+def _clear_pid_file(pid):
+    """Removes the PID file if it still refers to pid."""
+    try:
+        if int(BOT_PID_FILE.read_text()) == pid:
+            BOT_PID_FILE.unlink()
+    except (FileNotFoundError, ValueError):
+        pass
+
+def is_bot_running(max_age=BOT_POLL_TTL_SEC):
+    """Check if bot process is still running, reusing an alive result for up to max_age seconds."""
+    if st.session_state.bot_process is None:
+        # A bot started by another session or an earlier dashboard run
+        st.session_state.bot_process = _adopt_bot_process()
+        if st.session_state.bot_process is None:
+            return False
+    
+    now = time.monotonic()
+    last_alive = st.session_state.get("bot_alive_at")
+    if last_alive is not None and now - last_alive < max_age:
+        return True
     
     try:
         # Check if process is still alive
         poll = st.session_state.bot_process.poll()
         if poll is None:
+            st.session_state.bot_alive_at = now
             return True  # Still running
         else:
+            _clear_pid_file(st.session_state.bot_process.pid)
             st.session_state.bot_process = None
             return False  # Process ended
     except:
@@ -154,20 +683,23 @@ def is_bot_running():
 
 def start_bot():
     """Start the trading bot subprocess."""
-    if is_bot_running():
+    if is_bot_running(max_age=0):
         return False, "Bot is already running"
     
     if not BOT_SCRIPT_PATH.exists():
         return False, f"Bot script not found: {BOT_SCRIPT_PATH}"
     
     try:
-        # Start the bot process
-        st.session_state.bot_process = subprocess.Popen(
-            [str(PYTHON_EXECUTABLE), str(BOT_SCRIPT_PATH)],
-            cwd=str(BASE_DIR),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
+        # Start the bot process. Its output goes to a log file: nothing reads a pipe,
+        # so a full pipe buffer would block the bot on its next print
+        with open(BOT_LOG, "ab") as log_file:
+            st.session_state.bot_process = subprocess.Popen(
+                BOT_COMMAND,
+                cwd=str(BASE_DIR),
+                stdout=log_file,
+                stderr=subprocess.STDOUT
+            )
+        BOT_PID_FILE.write_text(str(st.session_state.bot_process.pid))
         return True, f"Bot started successfully! (PID: {st.session_state.bot_process.pid})"
     
     except Exception as e:
@@ -175,24 +707,136 @@ def start_bot():
 
 def stop_bot():
     """Stop the trading bot subprocess."""
-    if not is_bot_running():
+    if not is_bot_running(max_age=0):
         return False, "Bot is not running"
     
+    pid = st.session_state.bot_process.pid
     try:
         st.session_state.bot_process.terminate()
         st.session_state.bot_process.wait(timeout=10)  # Wait up to 10 seconds
         st.session_state.bot_process = None
+        _clear_pid_file(pid)
         return True, "Bot stopped successfully"
     
     except subprocess.TimeoutExpired:
         # Force kill if it doesn't terminate gracefully
         st.session_state.bot_process.kill()
         st.session_state.bot_process = None
+        _clear_pid_file(pid)
         return True, "Bot force-stopped"
     
     except Exception as e:
         return False, f"Error stopping bot: {e}"
 
+def _lttb_indices(values, target):
+    """Largest-Triangle-Three-Buckets downsampling of an evenly spaced series.
+
+    Returns the indices of target points that best preserve the series' visual shape;
+    the first and last points are always kept.
+    """
+    n = len(values)
+    if n <= target or target < 3:
+        return np.arange(n)
+    y = np.asarray(values, dtype=float)
+    x = np.arange(n, dtype=float)
+    # The interior points are split into target - 2 buckets, one point is kept from each
+    edges = np.linspace(1, n - 1, target - 1).astype(np.int64)
+    indices = np.empty(target, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(target - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # The next bucket's average (just the last point for the final bucket) is the third vertex
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[hi:next_hi].mean(), y[hi:next_hi].mean()
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+# --- Chart Builders ---
+# Plotly figure construction is pure Python; st.cache_data hashes the input arrays
+# so an unchanged series reuses the previously built figure. Only the latest figure is
+# ever reused, so each builder keeps just a couple of entries instead of one per bot update.
+# plotly itself is imported lazily so a cold start does not pay for it until a chart is drawn.
+@st.cache_data(show_spinner=False, max_entries=2)
+def build_price_fig(timestamps, prices, symbol):
+    """Builds the live price line chart, downsampled to at most MAX_CHART_POINTS points."""
+    import plotly.graph_objects as go
+    
+    # A partially written live_data.json can hold lists of different lengths; pair up the newest points
+    total_points = min(len(timestamps), len(prices))
+    timestamps = timestamps[len(timestamps) - total_points:]
+    prices = prices[len(prices) - total_points:]
+    if total_points > MAX_CHART_POINTS:
+        keep = _lttb_indices(prices, MAX_CHART_POINTS)
+        timestamps = np.asarray(timestamps)[keep]
+        prices = np.asarray(prices, dtype=float)[keep]
+    
+    fig = go.Figure()
+    # WebGL rendering keeps long series cheap in the browser
+    fig.add_trace(go.Scattergl(
+        x=timestamps, 
+        y=prices, 
+        mode='lines+markers',
+        name='Price',
+        line=dict(color='#00d4ff', width=2),
+        marker=dict(size=4 if len(prices) < 50 else 2)
+    ))
+    
+    fig.update_layout(
+        template="plotly_dark",
+        height=350,
+        title=f"{symbol} Live Price ({total_points} data points)",
+        xaxis_title="Time",
+        yaxis_title="Price (USDT)",
+        showlegend=False
+    )
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def build_cum_pnl_fig(exit_ts, cum_pnl):
+    """Builds the cumulative P&L line chart from the EXIT timestamps and running P&L arrays."""
+    import plotly.graph_objects as go
+    
+    # datetime64[ms] is serialized as a raw array rather than Timestamp by Timestamp
+    fig = go.Figure(go.Scattergl(
+        x=np.asarray(exit_ts, dtype="datetime64[ms]"),
+        y=cum_pnl,
+        mode="lines"
+    ))
+    fig.update_layout(
+        title="Cumulative P&L Over Time",
+        xaxis_title="Time",
+        yaxis_title="Cumulative P&L (USDT)",
+        height=400
+    )
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def build_pnl_hist_fig(exit_pnl):
+    """Builds the P&L distribution histogram."""
+    import plotly.express as px
+    
+    return px.histogram(
+        x=exit_pnl,
+        title="P&L Distribution",
+        nbins=20,
+        labels={"x": "P&L (USDT)"}
+    )
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def build_daily_trades_fig(dates, counts):
+    """Builds the daily trade count bar chart."""
+    import plotly.express as px
+    
+    return px.bar(
+        x=dates,
+        y=counts,
+        title="Daily Trading Activity",
+        labels={"x": "date", "y": "Number of Trades"}
+    )
+
 # --- Sidebar Controls ---
 with st.sidebar:
     st.header("⚙️ Bot Controls")
@@ -280,7 +924,7 @@ with st.sidebar:
             "strategy_name": strategy_choice.lower(),
             "symbol_ccxt": symbol,
             "total_budget_usdt": total_budget,
-            "last_updated": datetime.now().isoformat()
+            "last_updated": rerun_time.isoformat()
         }
         
         if strategy_choice == "Momentum":
@@ -298,6 +942,8 @@ with st.sidebar:
             })
         
         if save_config(new_config):
+            # Reuse what was just written instead of re-reading config.json this run
+            existing_config = new_config
             st.success(f"✅ {strategy_choice} settings saved!")
         else:
             st.error("❌ Failed to save settings!")
@@ -339,7 +985,10 @@ with st.sidebar:
     # Auto-refresh controls
     st.subheader("🔄 Auto-Refresh")
     auto_refresh = st.checkbox("Enable Auto-Refresh", value=True)
-    refresh_interval = st.slider("Refresh Interval (seconds)", 5, 60, 10, key="refresh_slider")
+    refresh_interval = st.slider(
+        "Max Refresh Interval (seconds)", 5, 60, 10, key="refresh_slider",
+        help="Refreshes come sooner when the bot is expected to have written new data"
+    )
     
     # Show last refresh time
     st.caption(f"Last refresh: {st.session_state.last_refresh.strftime('%H:%M:%S')}")
@@ -351,33 +1000,23 @@ with st.sidebar:
     st.caption("Generate fake price data to test the chart")
     
     if st.button("📊 Generate Test Data", use_container_width=True):
-        import random
-        
         # Generate realistic price movement
         base_price = 45000.0  # Starting BTC price
         num_points = 20
-        prices = []
-        timestamps = []
-        
-        current_time = datetime.now()
         
-        for i in range(num_points):
-            # Random walk with some trend
-            if i == 0:
-                price = base_price
-            else:
-                # Small random changes (-1% to +1%)
-                change_pct = random.uniform(-0.01, 0.01)
-                price = prices[-1] * (1 + change_pct)
-            
-            prices.append(round(price, 2))
-            timestamp = (current_time - timedelta(minutes=num_points-i)).isoformat()
-            timestamps.append(timestamp)
+        # Random walk: small random changes (-1% to +1%) compounded in one pass
+        changes = np.random.uniform(-0.01, 0.01, size=num_points - 1)
+        prices = base_price * np.concatenate(([1.0], np.cumprod(1 + changes)))
+        prices = np.round(prices, 2)
+        # One point per minute, ending a minute ago
+        timestamps = pd.date_range(
+            end=rerun_time - timedelta(minutes=1), periods=num_points, freq="1min"
+        ).strftime("%Y-%m-%dT%H:%M:%S").tolist()
         
         test_data = {
             "prices": prices,
             "timestamps": timestamps,
-            "last_update": datetime.now().isoformat(),
+            "last_update": rerun_time.isoformat(),
             "symbol": symbol,
             "test_data": True,
             "current_price": prices[-1],
@@ -388,12 +1027,11 @@ with st.sidebar:
             # Ensure directory exists
             LIVE_DATA_JSON.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(LIVE_DATA_JSON, "w") as f:
-                json.dump(test_data, f, indent=2)
+            _replace_file(LIVE_DATA_JSON, _dumps_json(test_data))
             
             st.success("✅ Test data generated!")
             st.write(f"📊 Generated {len(prices)} price points")
-            st.write(f"💰 Price range: ${min(prices):.2f} - ${max(prices):.2f}")
+            st.write(f"💰 Price range: ${prices.min():.2f} - ${prices.max():.2f}")
             
             time.sleep(2)
             st.rerun()
@@ -404,14 +1042,12 @@ with st.sidebar:
             
     # Add a button to generate CHANGING test data
     if st.button("🔄 Generate Changing Test Data", use_container_width=True):
-        import random
-        
         # Load existing test data or create new
         existing_data = None
-        if LIVE_DATA_JSON.exists():
+        key = _file_key(LIVE_DATA_JSON)
+        if key is not None:
             try:
-                with open(LIVE_DATA_JSON, "r") as f:
-                    existing_data = json.load(f)
+                existing_data = _load_json_cached(str(LIVE_DATA_JSON), *key)
             except:
                 pass
         
@@ -422,25 +1058,21 @@ with st.sidebar:
             
             # Add new price point
             last_price = prices[-1] if prices else 45000.0
-            change_pct = random.uniform(-0.02, 0.02)  # -2% to +2%
+            change_pct = np.random.uniform(-0.02, 0.02)  # -2% to +2%
             new_price = last_price * (1 + change_pct)
             
-            prices.append(round(new_price, 2))
-            timestamps.append(datetime.now().isoformat())
-            
             # Keep only last 50 points
-            if len(prices) > 50:
-                prices = prices[-50:]
-                timestamps = timestamps[-50:]
+            prices = prices[-49:] + [round(new_price, 2)]
+            timestamps = timestamps[-49:] + [rerun_time.isoformat()]
         else:
             # Create new data
-            prices = [45000.0 + random.uniform(-100, 100)]
-            timestamps = [datetime.now().isoformat()]
+            prices = [45000.0 + np.random.uniform(-100, 100)]
+            timestamps = [rerun_time.isoformat()]
         
         test_data = {
             "prices": prices,
             "timestamps": timestamps,
-            "last_update": datetime.now().isoformat(),
+            "last_update": rerun_time.isoformat(),
             "symbol": symbol,
             "test_data": True,
             "current_price": prices[-1],
@@ -448,8 +1080,7 @@ with st.sidebar:
         }
         
         try:
-            with open(LIVE_DATA_JSON, "w") as f:
-                json.dump(test_data, f, indent=2)
+            _replace_file(LIVE_DATA_JSON, _dumps_json(test_data))
             
             st.success(f"✅ Updated test data! Price: ${prices[-1]:.2f}")
             time.sleep(1)
@@ -468,6 +1099,12 @@ with st.sidebar:
         except Exception as e:
             st.error(f"❌ Failed to clear test data: {e}")
 
+# Change token of the bot's output files, taken before any of them is read: a write that lands
+# while this run renders then still differs from it and triggers the next rerun
+if auto_refresh:
+    watcher = _file_watcher()
+    run_start_changes = _change_token(watcher)
+
 # --- Main Dashboard Content ---
 st.title("🚀 AI Trading Bot Dashboard")
 
@@ -476,7 +1113,7 @@ if st.button("🔄 Force Refresh Data", key="force_refresh"):
     st.rerun()
 
 # Load data fresh every time
-trades_df = read_trades_df()
+trades_df, exits_df, action_counts = read_trades_df(fast_io=existing_config.get("fast_io", True))
 live_data = load_live_data()
 ai_status = load_ai_status()
 
@@ -500,29 +1137,32 @@ with col_status3:
     else:
         st.info("🤖 No AI status")
 
-# Create tabs
-tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview & Live Data", "📈 Performance", "🔄 Trade History", "⚙️ System Info"])
+# View selector: unlike st.tabs, only the selected view is built and sent on each rerun
+VIEWS = ["📊 Overview & Live Data", "📈 Performance", "🔄 Trade History", "⚙️ System Info"]
+view = st.radio("View", VIEWS, horizontal=True, key="view", label_visibility="collapsed")
 
-with tab1:
+if view == VIEWS[0]:
     # Two-column layout for main content and AI status
     col_main, col_ai = st.columns([3, 1])
     
     with col_main:
         st.subheader("💰 Portfolio Overview")
         
-        # Calculate metrics from EXIT trades only
-        exits_df = trades_df[trades_df['action'] == 'EXIT'].copy()
+        # Calculate metrics from EXIT trades only, straight on the NumPy arrays
+        exit_pnl = exits_df["pnl_usdt"].to_numpy()
         
-        if not exits_df.empty:
-            total_pnl = exits_df["pnl_usdt"].sum()
-            total_trades = len(exits_df)
-            winning_trades = len(exits_df[exits_df["pnl_usdt"] > 0])
-            win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-            avg_pnl = total_pnl / total_trades if total_trades > 0 else 0
+        if exit_pnl.size > 0:
+            total_pnl = np.nansum(exit_pnl)
+            total_trades = exit_pnl.size
+            win_rate = np.count_nonzero(exit_pnl > 0) / total_trades * 100
+            avg_pnl = total_pnl / total_trades
             
-            # Calculate daily P&L
-            exits_df['date'] = exits_df['ts_iso'].dt.date
-            today_pnl = exits_df[exits_df['date'] == datetime.now().date()]['pnl_usdt'].sum()
+            # Calculate daily P&L with a datetime64 range compare instead of building date objects
+            exit_ts = exits_df["ts_iso"]
+            day_start = pd.Timestamp(rerun_time.date(), tz=exit_ts.dt.tz).to_datetime64()
+            exit_ts = exit_ts.values
+            in_today = (exit_ts >= day_start) & (exit_ts < day_start + np.timedelta64(1, "D"))
+            today_pnl = np.nansum(exit_pnl[in_today])
         else:
             total_pnl, total_trades, win_rate, avg_pnl, today_pnl = 0, 0, 0, 0, 0
         
@@ -563,9 +1203,11 @@ with tab1:
     # Debug information
     col_debug1, col_debug2, col_debug3 = st.columns(3)
     with col_debug1:
-        if LIVE_DATA_JSON.exists():
-            file_mod_time = datetime.fromtimestamp(LIVE_DATA_JSON.stat().st_mtime)
-            time_diff = (datetime.now() - file_mod_time).total_seconds()
+        live_key = _file_key(LIVE_DATA_JSON)
+        if live_key is not None:
+            file_mod_time = datetime.fromtimestamp(live_key[0] / 1e9)
+            # The bot may have written after this rerun started
+            time_diff = max((rerun_time - file_mod_time).total_seconds(), 0)
             st.caption(f"📁 File modified: {file_mod_time.strftime('%H:%M:%S')}")
             if time_diff > 60:
                 st.caption(f"⚠️ File is {time_diff:.0f}s old!")
@@ -575,7 +1217,7 @@ with tab1:
             st.caption("📁 live_data.json not found")
     
     with col_debug2:
-        st.caption(f"🔄 Current time: {datetime.now().strftime('%H:%M:%S')}")
+        st.caption(f"🔄 Current time: {rerun_time.strftime('%H:%M:%S')}")
         st.caption(f"🔄 Refresh count: {st.session_state.get('refresh_count', 0)}")
     
     with col_debug3:
@@ -596,52 +1238,43 @@ with tab1:
         # Check for different possible data structures
         if "prices" in live_data:
             prices = live_data["prices"]
-            timestamps = live_data.get("timestamps", list(range(len(prices))))
+            timestamps = live_data.get("timestamps")
         elif "price_history" in live_data:
             prices = live_data["price_history"]
-            timestamps = live_data.get("time_history", list(range(len(prices))))
+            timestamps = live_data.get("time_history")
         elif "data" in live_data and isinstance(live_data["data"], list):
             prices = live_data["data"]
-            timestamps = list(range(len(prices)))
         elif "price" in live_data:
             # Single price point - create a simple list
             current_price = live_data["price"]
             prices = [current_price]
-            timestamps = [datetime.now().strftime("%H:%M:%S")]
+            timestamps = [rerun_time.strftime("%H:%M:%S")]
             st.info("📊 Showing single price point. Bot may need time to collect historical data.")
         
         if prices and len(prices) > 0:
+            # Only the most recent points are considered; the chart downsamples them further
+            total_points = len(prices)
+            if total_points > MAX_PRICE_HISTORY:
+                prices = prices[-MAX_PRICE_HISTORY:]
+                timestamps = timestamps[-MAX_PRICE_HISTORY:] if timestamps else timestamps
+            
             # Handle different timestamp formats
             if timestamps and len(timestamps) > 0:
                 # Try to parse timestamps if they're strings
                 if isinstance(timestamps[0], str):
                     try:
-                        parsed_timestamps = [pd.to_datetime(ts) for ts in timestamps]
-                        timestamps = parsed_timestamps
+                        # One vectorized parse; the ISO 8601 fast path covers what the bot writes
+                        try:
+                            timestamps = pd.to_datetime(timestamps, format="ISO8601").values
+                        except ValueError:
+                            timestamps = pd.to_datetime(timestamps).values
                     except:
                         # If parsing fails, use indices
-                        timestamps = list(range(len(prices)))
+                        timestamps = _X_AXIS[:len(prices)]
             else:
-                timestamps = list(range(len(prices)))
+                timestamps = _X_AXIS[:len(prices)]
             
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=timestamps, 
-                y=prices, 
-                mode='lines+markers',
-                name='Price',
-                line=dict(color='#00d4ff', width=2),
-                marker=dict(size=4 if len(prices) < 50 else 2)
-            ))
-            
-            fig.update_layout(
-                template="plotly_dark",
-                height=350,
-                title=f"{symbol} Live Price ({len(prices)} data points)",
-                xaxis_title="Time",
-                yaxis_title="Price (USDT)",
-                showlegend=False
-            )
+            fig = build_price_fig(timestamps, prices, symbol)
             
             st.plotly_chart(fig, use_container_width=True)
             
@@ -654,7 +1287,7 @@ with tab1:
                 col1, col2, col3 = st.columns(3)
                 col1.metric("Current Price", f"${current_price:.4f}")
                 col2.metric("Price Change", f"${price_change:.4f}", f"{price_change_pct:.2f}%")
-                col3.metric("Data Points", len(prices))
+                col3.metric("Data Points", total_points)
             elif len(prices) == 1:
                 col1, col2 = st.columns(2)
                 col1.metric("Current Price", f"${prices[0]:.4f}")
@@ -681,24 +1314,16 @@ OR
         st.write("3. 🔄 Verify the bot is updating the file regularly")
         st.write("4. 🐛 Enable 'Debug Live Data' in sidebar to see data structure")
 
-with tab2:
+if view == VIEWS[1]:
     st.subheader("📈 Performance Analysis")
     
     if not trades_df.empty:
-        exits_df = trades_df[trades_df['action'] == 'EXIT'].copy()
+        exit_pnl = exits_df["pnl_usdt"].to_numpy()
+        exit_ts = exits_df["ts_iso"]
         
-        if not exits_df.empty:
+        if exit_pnl.size > 0:
             # Cumulative P&L chart
-            exits_df["cumulative_pnl"] = exits_df["pnl_usdt"].cumsum()
-            
-            fig = px.line(
-                exits_df, 
-                x="ts_iso", 
-                y="cumulative_pnl",
-                title="Cumulative P&L Over Time",
-                labels={"cumulative_pnl": "Cumulative P&L (USDT)", "ts_iso": "Time"}
-            )
-            fig.update_layout(height=400)
+            fig = build_cum_pnl_fig(exit_ts.values, exits_df["cumulative_pnl"].to_numpy())
             st.plotly_chart(fig, use_container_width=True)
             
             # Additional performance metrics
@@ -706,42 +1331,24 @@ with tab2:
             
             with col1:
                 # P&L distribution histogram
-                fig_hist = px.histogram(
-                    exits_df,
-                    x="pnl_usdt",
-                    title="P&L Distribution",
-                    nbins=20,
-                    labels={"pnl_usdt": "P&L (USDT)"}
-                )
-                st.plotly_chart(fig_hist, use_container_width=True)
+                st.plotly_chart(build_pnl_hist_fig(exit_pnl), use_container_width=True)
             
             with col2:
                 # Daily trading activity
-                exits_df["date"] = exits_df["ts_iso"].dt.date
-                daily_stats = exits_df.groupby("date").agg({
-                    "pnl_usdt": ["count", "sum"]
-                }).reset_index()
-                daily_stats.columns = ["date", "trades", "pnl"]
-                
-                fig_daily = px.bar(
-                    daily_stats,
-                    x="date",
-                    y="trades",
-                    title="Daily Trading Activity",
-                    labels={"trades": "Number of Trades"}
-                )
+                daily_trades = exit_ts.dt.date.value_counts().sort_index()
+                fig_daily = build_daily_trades_fig(daily_trades.index.values, daily_trades.values)
                 st.plotly_chart(fig_daily, use_container_width=True)
         else:
             st.info("No completed trades to analyze yet.")
     else:
         st.info("📊 No performance data to display. Start trading to see analytics here.")
 
-with tab3:
+if view == VIEWS[2]:
     st.subheader("🔄 Trade History")
     
     if not trades_df.empty:
-        # Trade history with better formatting
-        display_df = trades_df.sort_values("ts_iso", ascending=False).head(100)
+        # Trade history with better formatting (trades_df is already sorted ascending)
+        display_df = trades_df.tail(100).iloc[::-1]
         
         st.dataframe(
             display_df,
@@ -760,8 +1367,9 @@ with tab3:
         
         # Trade summary
         st.subheader("📋 Trade Summary")
-        entries = len(trades_df[trades_df['action'] == 'ENTRY'])
-        exits = len(trades_df[trades_df['action'] == 'EXIT'])
+        # Counted by the loader as rows arrive, so no scan of the trade history here
+        entries = int(action_counts.get("ENTRY", 0))
+        exits = len(exits_df)
         
         col1, col2, col3 = st.columns(3)
         col1.metric("Total Entries", entries)
@@ -771,20 +1379,12 @@ with tab3:
     else:
         st.info("📝 No trade history available yet.")
 
-with tab4:
+if view == VIEWS[3]:
     st.subheader("⚙️ System Information")
     
     # File status
     st.write("**📁 File Status:**")
-    files_status = {
-        "Bot Script": BOT_SCRIPT_PATH.exists(),
-        "Config File": CONFIG_JSON.exists(),
-        "Trades CSV": TRADES_CSV.exists(),
-        "Live Data": LIVE_DATA_JSON.exists(),
-        "AI Status": AI_STATUS_JSON.exists()
-    }
-    
-    for file_name, exists in files_status.items():
+    for file_name, exists in file_status().items():
         if exists:
             st.success(f"✅ {file_name}")
         else:
@@ -799,14 +1399,18 @@ with tab4:
     
     # Live data file contents
     st.write("**📊 Live Data File Contents:**")
-    if LIVE_DATA_JSON.exists():
+    live_key = _file_key(LIVE_DATA_JSON)
+    if live_key is not None:
         try:
             with open(LIVE_DATA_JSON, "r") as f:
-                live_file_contents = f.read()
+                live_file_contents = f.read(LIVE_DATA_PREVIEW_CHARS)
             st.code(live_file_contents, language="json")
             
-            file_size = LIVE_DATA_JSON.stat().st_size
-            st.caption(f"File size: {file_size} bytes")
+            file_size = live_key[1]
+            if file_size > LIVE_DATA_PREVIEW_CHARS:
+                st.caption(f"File size: {file_size} bytes (showing the first {LIVE_DATA_PREVIEW_CHARS} characters)")
+            else:
+                st.caption(f"File size: {file_size} bytes")
         except Exception as e:
             st.error(f"Error reading live data file: {e}")
     else:
@@ -816,10 +1420,11 @@ with tab4:
     st.write("**💻 System Info:**")
     st.write(f"- Python Executable: `{PYTHON_EXECUTABLE}`")
     st.write(f"- Working Directory: `{BASE_DIR}`")
-    st.write(f"- Bot Process Status: {'Running' if is_bot_running() else 'Stopped'}")
+    bot_running = is_bot_running()
+    st.write(f"- Bot Process Status: {'Running' if bot_running else 'Stopped'}")
     
     # Bot process info
-    if is_bot_running():
+    if bot_running:
         st.write(f"- Bot PID: {st.session_state.bot_process.pid}")
         try:
             poll_result = st.session_state.bot_process.poll()
@@ -829,11 +1434,22 @@ with tab4:
 
 # --- Auto-Refresh Logic ---
 if auto_refresh:
-    # Increment refresh counter
-    if 'refresh_count' not in st.session_state:
-        st.session_state.refresh_count = 0
-    st.session_state.refresh_count += 1
-    
-    time.sleep(refresh_interval)
-    st.session_state.last_refresh = datetime.now()
-    st.rerun()
+    next_interval = next_refresh_interval(refresh_interval)
+    if watcher is None and st_autorefresh is not None:
+        # The browser schedules the next rerun, so no script thread sleeps in between
+        st_autorefresh(interval=int(next_interval * 1000), key="auto_refresh")
+    else:
+        st.session_state.last_seen_changes = run_start_changes
+        st.session_state.last_full_run = time.monotonic()
+        
+        # With watchdog a change check is an integer compare, so it can run every second;
+        # without it, each check stat()s the files and runs on the adaptive interval
+        @st.fragment(run_every=MIN_REFRESH_INTERVAL_SEC if watcher is not None else next_interval)
+        def _watch_for_changes():
+            """Reruns the whole page once one of the bot's output files has changed, or when the
+            adaptive interval says the bot's next update is due (at most refresh_interval)."""
+            if (_change_token(watcher) != st.session_state.last_seen_changes
+                    or time.monotonic() - st.session_state.last_full_run >= next_interval):
+                st.rerun()
+        
+        _watch_for_changes()
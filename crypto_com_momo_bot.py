@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 import os, json, time, asyncio, logging, math, csv, pathlib, datetime as dt
 from dataclasses import dataclass
-from collections import deque
 from dotenv import load_dotenv
+import numpy as np
+
+try:
+    import orjson  # Serializes the chart arrays without building Python lists
+except ImportError:
+    orjson = None
 
 # --- All imports are now grouped here at the top ---
 from strategies.scalping_strategy import ScalpingStrategy
@@ -21,13 +26,37 @@ logging.getLogger("asyncio").setLevel(logging.WARNING)
 log = logging.getLogger("momo")
 
 # ---------- Data Handlers for Dashboard ----------
-chart_data = deque(maxlen=200)
+CHART_POINTS = 200
+# Ring buffer of the latest chart points, one array per field; point i lives in slot i % CHART_POINTS
+_chart_ts = np.zeros(CHART_POINTS, dtype="datetime64[ms]")
+_chart_px = np.zeros(CHART_POINTS, dtype=np.float64)
+_chart_i = 0
+def record_chart_point(ts_ms, price):
+    """Adds one price (at epoch milliseconds ts_ms) to the live chart, evicting the oldest."""
+    global _chart_i
+    slot = _chart_i % CHART_POINTS
+    _chart_ts[slot] = ts_ms
+    _chart_px[slot] = price
+    _chart_i += 1
 def save_live_data(trade_event=None):
-    output = { "prices": list(chart_data) }
+    # Oldest point first: once the buffer has wrapped it starts at the next slot to be overwritten
+    order = np.arange(_chart_i - min(_chart_i, CHART_POINTS), _chart_i) % CHART_POINTS
+    output = { "prices": _chart_px[order], "timestamps": _chart_ts[order] }
     if trade_event:
         output["trade"] = trade_event
-    with open("live_data.json", "w") as f:
-        json.dump(output, f)
+    if orjson is not None:
+        payload = orjson.dumps(output, option=orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        output["prices"] = output["prices"].tolist()
+        output["timestamps"] = np.datetime_as_string(output["timestamps"], unit="ms").tolist()
+        payload = json.dumps(output).encode()
+    # Write a temp file and rename it over the old one so the dashboard never reads a partial file
+    with open("live_data.json.tmp", "wb") as f:
+        f.write(payload)
+    try:
+        os.replace("live_data.json.tmp", "live_data.json")
+    except PermissionError:
+        pass  # Windows: the dashboard has the file open right now; the next tick rewrites it
 
 # ---------- config ----------
 def load_config():
@@ -51,6 +80,7 @@ class Config:
     throttle_window: int = int(os.getenv("THROTTLE_WINDOW", "20"))
     throttle_threshold_pct: float = float(os.getenv("THROTTLE_THRESHOLD", "0.40"))
     daily_drawdown_pct: float = float(os.getenv("DRAWDOWN_PCT", "0.02"))
+    sentiment_ttl_sec: float = float(os.getenv("SENTIMENT_TTL_SEC", "1.0"))  # How long approvals reuse a sentiment read
 
     # --- Budget & Position Settings ---
     total_budget_usdt: float = float(bot_config.get("total_budget_usdt", "1000"))
@@ -80,11 +110,29 @@ def _ensure_trades_header():
     if not TRADES_CSV.exists() or TRADES_CSV.stat().st_size == 0:
         with TRADES_CSV.open("w", newline="", encoding="utf-8") as f:
             csv.writer(f).writerow(["ts_iso","symbol","action","side","price","qty","reason","pnl_usdt"])
-def _log_trade(symbol, action, side, price, qty, reason="", pnl_usdt=""):
+TRADE_LOG_BATCH_ROWS = 1024  # Buffered rows that force a flush
+_LOG_BUFFER = []
+def flush_trade_log():
+    """Appends all buffered trade rows to trades.csv with a single open."""
+    if not _LOG_BUFFER:
+        return
     _ensure_trades_header()
-    row = [dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"), symbol, action, side, f"{price:.8f}", f"{qty:.8f}", reason, f"{pnl_usdt:.8f}" if pnl_usdt else ""]
     with TRADES_CSV.open("a", newline="", encoding="utf-8") as f:
-        csv.writer(f).writerow(row)
+        csv.writer(f).writerows(_LOG_BUFFER)
+    _LOG_BUFFER.clear()
+def _buffer_trade(symbol, action, side, price, qty, reason="", pnl_usdt="", ts_override=None):
+    """Queues a trade row; callers must flush_trade_log() when done (used by the backtester).
+
+    ts_override replaces the wall-clock trade time, e.g. with the time of a replayed tick.
+    """
+    ts_iso = ts_override or dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds")
+    _LOG_BUFFER.append([ts_iso, symbol, action, side, f"{price:.8f}", f"{qty:.8f}", reason, f"{pnl_usdt:.8f}" if pnl_usdt else ""])
+    if len(_LOG_BUFFER) >= TRADE_LOG_BATCH_ROWS:
+        flush_trade_log()
+def _log_trade(symbol, action, side, price, qty, reason="", pnl_usdt=""):
+    # The live bot writes each trade right away so the dashboard picks it up
+    _buffer_trade(symbol, action, side, price, qty, reason, pnl_usdt)
+    flush_trade_log()
 
 # --- Bot Entry Point ---
 async def main():
@@ -109,3 +157,5 @@ if __name__ == "__main__":
         asyncio.run(main())
     except KeyboardInterrupt:
         print("Bot stopped by user.")
+    finally:
+        flush_trade_log()
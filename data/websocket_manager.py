@@ -3,6 +3,21 @@ import json
 import websockets
 import time
 
+try:
+    import orjson  # Faster parsing for bursty market data
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+else:
+    _loads, _dumps = json.loads, json.dumps
+
+MAX_MESSAGE_BATCH = 256  # Upper bound on messages handled per event-loop turn
+SENTIMENT_RETRY_SEC = 5  # Shortest wait between sentiment refresh attempts, e.g. after a failure
+
 class WebSocketManager:
     def __init__(self, url, strategy, risk_manager, execution_engine, ai_analyzer):
         self._url = url
@@ -11,9 +26,12 @@ class WebSocketManager:
         self.execution_engine = execution_engine
         self.ai_analyzer = ai_analyzer
         self.ws = None
+        self._sentiment_task = None
 
     async def connect(self):
         """Establishes a persistent WebSocket connection with a reconnect loop."""
+        if self._sentiment_task is None:
+            self._sentiment_task = asyncio.create_task(self._sentiment_refresher())
         while True:
             try:
                 print("Connecting to WebSocket...")
@@ -28,6 +46,19 @@ class WebSocketManager:
                 print(f"An error occurred: {e}. Reconnecting in 5 seconds...")
             await asyncio.sleep(5)
 
+    async def _sentiment_refresher(self):
+        """Refreshes the AI sentiment once per cache period, off the message path."""
+        analyzer = self.ai_analyzer
+        while True:
+            try:
+                await analyzer.refresh_sentiment()
+            except Exception as e:
+                print(f"AI sentiment refresh failed: {e}")
+            # Wake when the current sentiment expires, which may be soon if it was restored from
+            # ai_status.json after a restart, rather than a full cache period from now
+            due = analyzer.last_analysis_time + analyzer.cache_duration - time.time()
+            await asyncio.sleep(max(due, SENTIMENT_RETRY_SEC))
+
     async def subscribe(self):
         """Subscribes to the necessary data streams for scalping."""
         symbols = ["BTC_USDT", "ETH_USDT"] 
@@ -40,25 +71,36 @@ class WebSocketManager:
             "params": {"channels": ticker_channels + book_channels},
             "nonce": int(time.time() * 1000)
         }
-        await self.ws.send(json.dumps(subscription_request))
+        await self.ws.send(_dumps(subscription_request))
         print(f"Subscribed to channels: {ticker_channels + book_channels}")
 
     async def listen(self):
-        """Listens for incoming messages and routes them."""
-        self.ai_analyzer.refresh_sentiment()
-        
+        """Listens for incoming messages and routes them, a burst at a time."""
         async for message in self.ws:
-            data = json.loads(message)
-            
-            if data.get("method") == "public/heartbeat":
-                await self.ws.send(json.dumps({
-                    "id": data.get("id"),
-                    "method": "public/respond-heartbeat"
-                }))
-                continue
-
-            self.ai_analyzer.refresh_sentiment()
-            self._route_data(data)
+            batch = [message]
+            await self._drain_buffered(batch)
+
+            for message in batch:
+                data = _loads(message)
+
+                if data.get("method") == "public/heartbeat":
+                    await self.ws.send(_dumps({
+                        "id": data.get("id"),
+                        "method": "public/respond-heartbeat"
+                    }))
+                    continue
+
+                self._route_data(data)
+
+    async def _drain_buffered(self, batch):
+        """Appends messages the connection has already received to batch, without waiting for new ones."""
+        while len(batch) < MAX_MESSAGE_BATCH:
+            try:
+                # A zero timeout only fires if recv() has to wait; buffered messages return first
+                async with asyncio.timeout(0):
+                    batch.append(await self.ws.recv())
+            except TimeoutError:
+                return
 
     def _route_data(self, data):
         """Parses data, gets signal, checks risk, and passes to execution."""
@@ -1,21 +1,62 @@
 import math
 import time
 import numpy as np
-from collections import deque
+from trading.risk_manager import Signal
+
+try:
+    from numba import njit  # Optional JIT for the per-tick math
+except ImportError:
+    def njit(*args, **kwargs):
+        """Without numba the kernels simply run as plain Python."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # --- Math Helper Functions for this Strategy ---
-def ema(prev, x, alpha):
-    return alpha * x + (1 - alpha) * prev if prev is not None else x
-
-def zscore(series, window=60):
-    if len(series) < window:
-        return 0.0
-    arr = np.array(list(series))[-window:]
-    mu = arr.mean()
-    sd = arr.std(ddof=1)
+@njit(cache=True)
+def momo_step(window, sums, count, px, prev_ema, alpha):
+    """Advances the EMA and z-score by one price in O(1), without allocating.
+
+    window is a ring buffer of the last len(window) prices and count is how many
+    prices were seen before px. sums holds [shift, s1, s2], the running sum and sum
+    of squares of (price - shift) over the window: each tick adds px and evicts the
+    oldest price. Returns (ema, zscore); the z-score stays 0.0 until the window is full.
+    """
+    ema = alpha * px + (1 - alpha) * prev_ema if count > 0 else px
+    n = window.shape[0]
+    slot = count % n
+    if count >= n:
+        old = window[slot] - sums[0]
+        sums[1] -= old
+        sums[2] -= old * old
+    window[slot] = px
+    new = px - sums[0]
+    sums[1] += new
+    sums[2] += new * new
+
+    if slot == n - 1:
+        # Once per lap, re-center on the window mean and recompute the sums exactly:
+        # rounding errors cannot build up, and the small deviations keep s2 - s1^2/n precise
+        mu = 0.0
+        for i in range(n):
+            mu += window[i]
+        mu /= n
+        s1 = 0.0
+        s2 = 0.0
+        for i in range(n):
+            d = window[i] - mu
+            s1 += d
+            s2 += d * d
+        sums[0], sums[1], sums[2] = mu, s1, s2
+    if count + 1 < n or n < 2:
+        return ema, 0.0
+
+    mu = sums[0] + sums[1] / n
+    var = max((sums[2] - sums[1] * sums[1] / n) / (n - 1), 0.0)
+    sd = math.sqrt(var)
     if sd < 1e-12:
         sd = 1.0
-    return float((arr[-1] - mu) / sd)
+    return ema, (px - mu) / sd
 
 
 # --- The Original Momentum Strategy Class ---
@@ -23,10 +64,21 @@ class MomentumStrategy:
     def __init__(self, cfg):
         self.cfg = cfg
         self.last_signal_ts = 0.0
-        self.prices = deque(maxlen=max(cfg.ema_len, cfg.zscore_len) * 3)
-        self._ema = None
+        # Ring buffer of the last zscore_len prices, their running [shift, sum, sum of squares]
+        # (see momo_step), plus how many prices have been seen
+        self._window = np.empty(cfg.zscore_len, dtype=np.float64)
+        self._sums = np.zeros(3, dtype=np.float64)
+        self._count = 0
+        self._ema = 0.0
+        self._alpha = 2 / (cfg.ema_len + 1)
+        # cfg values read on every tick, resolved once
+        self._zlen, self._zentry = cfg.zscore_len, cfg.zscore_entry
+        self._tp, self._sl, self._cooldown_sec = cfg.take_profit_pct, cfg.stop_loss_pct, cfg.cooldown_sec
         self.pos = None  # Example: {"side":"LONG","qty":float,"entry":float}
-        self._tick = 0
+
+    def on_tick(self, price, timestamp):
+        """Backtest entry point; momentum only looks at the price."""
+        return self.on_price(price)
 
     def on_price(self, px: float):
         """This method is for the momentum strategy and gets called by the live bot."""
@@ -34,30 +86,30 @@ class MomentumStrategy:
             return None
 
         # --- Calculate Indicators ---
-        alpha = 2 / (self.cfg.ema_len + 1)
-        self._ema = ema(self._ema, px, alpha)
-        self.prices.append(px)
-        
+        self._ema, zs = momo_step(self._window, self._sums, self._count, float(px), self._ema, self._alpha)
+        self._count += 1
+
         # --- Entry Logic ---
-        if self.pos is None and len(self.prices) >= self.cfg.zscore_len:
-            momentum = px - (self._ema or px)
-            zs = zscore(self.prices, self.cfg.zscore_len)
-            
-            if momentum > 0 and zs > self.cfg.zscore_entry and not self._cooldown():
+        pos = self.pos
+        if pos is None and self._count >= self._zlen:
+            momentum = px - self._ema
+
+            if momentum > 0 and zs > self._zentry and not self._cooldown():
                 self.last_signal_ts = time.time()
-                return {"action": "enter_long", "price": px}
+                return Signal("enter_long", px)
 
         # --- Exit Logic ---
-        if self.pos:
-            tp = self.pos["entry"] * (1 + self.cfg.take_profit_pct)
-            sl = self.pos["entry"] * (1 + self.cfg.stop_loss_pct)
-            
+        if pos:
+            entry = pos["entry"]
+            tp = entry * (1 + self._tp)
+            sl = entry * (1 + self._sl)
+
             if px >= tp:
-                return {"action": "exit", "price": px, "reason": "tp"}
+                return Signal("exit", px, "tp")
             if px <= sl:
-                return {"action": "exit", "price": px, "reason": "sl"}
+                return Signal("exit", px, "sl")
 
         return None
 
     def _cooldown(self):
-        return (time.time() - self.last_signal_ts) < self.cfg.cooldown_sec
\ No newline at end of file
+        return (time.time() - self.last_signal_ts) < self._cooldown_sec
@@ -1,39 +1,59 @@
-import pandas as pd
-import pandas_ta as ta
+import math
 import logging
+from trading.risk_manager import Signal
+
+EMA_FAST_LEN = 9
+EMA_SLOW_LEN = 21
+RSI_LEN = 14
+MIN_CANDLES = EMA_SLOW_LEN + 1  # The slow EMA needs a previous value to detect a cross
+NS_PER_MINUTE = 60_000_000_000
+# Smoothing factors, computed once rather than on every candle
+_EMA_FAST_ALPHA = 2 / (EMA_FAST_LEN + 1)
+_EMA_SLOW_ALPHA = 2 / (EMA_SLOW_LEN + 1)
+_RSI_DECAY = 1 - 1 / RSI_LEN  # Wilder smoothing, alpha = 1/RSI_LEN
 
 class ScalpingStrategy:
     def __init__(self, cfg):
         self.cfg = cfg
-        self.candles = pd.DataFrame(columns=['open', 'high', 'low', 'close', 'volume'])
+        self._n_candles = 0  # Finalized candles so far
         self.current_candle = None
-        self.last_candle_timestamp = None
+        self.last_candle_minute = None  # Epoch minute of the open candle
         self.latest_bid = None
         self.latest_ask = None
+        # Indicator state, advanced in O(1) per finalized candle (see _update_indicators).
+        # During warm-up the EMA slots hold running sums of their seed window; the gain/loss slots are
+        # decayed sums, whose common normalization cancels out of the RSI ratio.
+        self._ema9 = self._ema21 = 0.0
+        self._prev_ema9 = self._prev_ema21 = math.nan
+        self._avg_gain = self._avg_loss = 0.0
+        self._prev_close = None
+        self._rsi_oversold, self._rsi_overbought = cfg.rsi_oversold, cfg.rsi_overbought
         # --- ADDED: Initialize the logger ---
         self.log = logging.getLogger("momo")
         self.log.info("ScalpingStrategy Initialized with TA, Spread tracking, and Logging.")
 
     def on_tick_update(self, tick_data):
-        """Builds 1-minute candles from historical ticks and returns True when a candle is finalized."""
+        """Builds 1-minute candles from ticks and returns True when a candle is finalized.
+
+        tick_data['timestamp'] is the trade time in epoch nanoseconds.
+        """
         price = tick_data.get('price')
         timestamp = tick_data.get('timestamp')
         if price is None or timestamp is None:
             return False
 
-        current_candle_ts = timestamp.floor('1min')
+        minute = timestamp // NS_PER_MINUTE
         candle_finalized = False
 
-        if self.last_candle_timestamp and self.last_candle_timestamp < current_candle_ts:
-            self.candles.loc[self.last_candle_timestamp] = self.current_candle
-            if len(self.candles) > 100:
-                self.candles.drop(self.candles.index[0], inplace=True)
+        if self.last_candle_minute is not None and self.last_candle_minute < minute:
+            candle = self.current_candle
+            self._on_candle_closed(candle['open'], candle['high'], candle['low'], candle['close'], candle['volume'])
             self.current_candle = None
             candle_finalized = True
 
         if self.current_candle is None:
             self.current_candle = {'open': price, 'high': price, 'low': price, 'close': price, 'volume': 0}
-            self.last_candle_timestamp = current_candle_ts
+            self.last_candle_minute = minute
         
         self.current_candle['high'] = max(self.current_candle['high'], price)
         self.current_candle['low'] = min(self.current_candle['low'], price)
@@ -41,6 +61,13 @@ class ScalpingStrategy:
         
         return candle_finalized
 
+    def on_tick(self, price, timestamp):
+        """Backtest entry point: quotes a 1bp spread around the trade price and returns a signal on candle close."""
+        self.on_order_book_update({'bids': [[price, 1]], 'asks': [[price * 1.0001, 1]]})
+        if self.on_tick_update({'price': price, 'timestamp': timestamp}):
+            return self.generate_signal()
+        return None
+
     def on_order_book_update(self, order_book):
         """Captures the latest bid and ask."""
         if 'bids' in order_book and order_book['bids']:
@@ -48,36 +75,69 @@ class ScalpingStrategy:
         if 'asks' in order_book and order_book['asks']:
             self.latest_ask = float(order_book['asks'][0][0])
     
+    def _on_candle_closed(self, open_, high, low, close, volume=0):
+        """Advances the indicators with a finalized candle; they only need its close."""
+        self._n_candles += 1
+        self._update_indicators(close)
+
+    @staticmethod
+    def _ema_next(ema, close, n, length, alpha):
+        """One step of an SMA-seeded EMA (as in pandas-ta): sums the first `length` closes, then smooths."""
+        if n < length:
+            return ema + close
+        if n == length:
+            return (ema + close) / length
+        return alpha * close + (1 - alpha) * ema
+
+    def _update_indicators(self, close):
+        """Advances EMA9/EMA21 and the RSI14 gain/loss averages with the close of a finalized candle."""
+        n = self._n_candles
+        self._prev_ema9, self._prev_ema21 = self._ema9, self._ema21
+        self._ema9 = self._ema_next(self._ema9, close, n, EMA_FAST_LEN, _EMA_FAST_ALPHA)
+        self._ema21 = self._ema_next(self._ema21, close, n, EMA_SLOW_LEN, _EMA_SLOW_ALPHA)
+
+        if self._prev_close is not None:
+            change = close - self._prev_close
+            gain, loss = max(change, 0.0), max(-change, 0.0)
+            # Decayed sums weighted from the first change, like pandas-ta's rma
+            self._avg_gain = gain + _RSI_DECAY * self._avg_gain
+            self._avg_loss = loss + _RSI_DECAY * self._avg_loss
+        self._prev_close = close
+
+    def _rsi(self):
+        total = self._avg_gain + self._avg_loss
+        if self._n_candles <= RSI_LEN or total == 0:
+            return math.nan
+        return 100 * self._avg_gain / total
+
     def generate_signal(self):
-        """Calculates indicators and generates a buy/sell signal if conditions are met."""
-        if len(self.candles) < 22:
+        """Generates a buy/sell signal from the indicators of the last finalized candles."""
+        if self._n_candles < MIN_CANDLES:
             return None
 
-        # Calculate Indicators
-        self.candles.ta.ema(length=9, append=True, col_names=('EMA_9',))
-        self.candles.ta.ema(length=21, append=True, col_names=('EMA_21',))
-        self.candles.ta.rsi(length=14, append=True, col_names=('RSI_14',))
-        
-        last_row = self.candles.iloc[-1]
-        prev_row = self.candles.iloc[-2]
+        close = self._prev_close
+        rsi = self._rsi()
+        ema9, ema21 = self._ema9, self._ema21
+        prev_ema9, prev_ema21 = self._prev_ema9, self._prev_ema21
 
         # --- Detailed Logging ---
-        self.log.debug(f"Checking signals: Price={last_row['close']:.4f}, RSI={last_row['RSI_14']:.2f}, EMA9={last_row['EMA_9']:.4f}, EMA21={last_row['EMA_21']:.4f}")
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("Checking signals: Price=%.4f, RSI=%.2f, EMA9=%.4f, EMA21=%.4f", close, rsi, ema9, ema21)
 
         # --- Signal Logic ---
-        ema_buy_signal = prev_row['EMA_9'] < prev_row['EMA_21'] and last_row['EMA_9'] > last_row['EMA_21']
-        rsi_buy_signal = last_row['RSI_14'] < self.cfg.rsi_oversold
+        ema_buy_signal = prev_ema9 < prev_ema21 and ema9 > ema21
+        rsi_buy_signal = rsi < self._rsi_oversold
         
-        ema_sell_signal = prev_row['EMA_9'] > prev_row['EMA_21'] and last_row['EMA_9'] < last_row['EMA_21']
-        rsi_sell_signal = last_row['RSI_14'] > self.cfg.rsi_overbought
+        ema_sell_signal = prev_ema9 > prev_ema21 and ema9 < ema21
+        rsi_sell_signal = rsi > self._rsi_overbought
         
         # --- Decision Making ---
         if ema_buy_signal or rsi_buy_signal:
-            self.log.info(f"TRADE SIGNAL DETECTED: BUY | RSI={last_row['RSI_14']:.2f}, Bullish EMA Cross={ema_buy_signal}")
-            return {"action": "enter_long", "price": last_row['close']}
+            self.log.info(f"TRADE SIGNAL DETECTED: BUY | RSI={rsi:.2f}, Bullish EMA Cross={ema_buy_signal}")
+            return Signal("enter_long", close)
         
         if ema_sell_signal or rsi_sell_signal:
-            self.log.info(f"TRADE SIGNAL DETECTED: SELL | RSI={last_row['RSI_14']:.2f}, Bearish EMA Cross={ema_sell_signal}")
-            return {"action": "exit", "price": last_row['close']}
+            self.log.info(f"TRADE SIGNAL DETECTED: SELL | RSI={rsi:.2f}, Bearish EMA Cross={ema_sell_signal}")
+            return Signal("exit", close)
 
         return None
@@ -0,0 +1,62 @@
+import types
+
+from trading.risk_manager import RiskManager, Signal
+
+
+def make_risk_manager(sentiment="Bullish", throttle_window=4):
+    cfg = types.SimpleNamespace(total_budget_usdt=1000.0, daily_drawdown_pct=0.1, throttle_window=throttle_window,
+                                throttle_threshold_pct=0.5, sentiment_ttl_sec=1.0)
+    analyzer = types.SimpleNamespace(get_current_sentiment=lambda: sentiment)
+    return RiskManager(cfg, analyzer)
+
+
+def runtime_str(s):
+    """An equal copy of s that is not the interned object."""
+    copy = "".join([s[:1], s[1:]])
+    assert copy == s and copy is not s
+    return copy
+
+
+def test_bearish_veto_with_non_interned_strings():
+    bearish = runtime_str("Bearish")
+    enter_long = runtime_str("enter_long")
+    assert not make_risk_manager(sentiment=bearish).approve_trade(Signal("enter_long", 1.0), 1000.0)
+    assert not make_risk_manager(sentiment="Bearish").approve_trade(Signal(enter_long, 1.0), 1000.0)
+    assert not make_risk_manager(sentiment=bearish).approve_trade(Signal(enter_long, 1.0), 1000.0)
+    assert make_risk_manager(sentiment=runtime_str("Bullish")).approve_trade(Signal(enter_long, 1.0), 1000.0)
+
+
+def test_exit_is_not_vetoed_by_sentiment():
+    assert make_risk_manager(sentiment="Bearish").approve_trade(Signal(runtime_str("exit"), 1.0), 1000.0)
+
+
+def history_state(rm):
+    return rm.mask, rm.count, rm._paused
+
+
+def assert_batch_matches_scalar(batches, throttle_window=4):
+    scalar, batched = make_risk_manager(throttle_window=throttle_window), make_risk_manager(throttle_window=throttle_window)
+    for pnls in batches:
+        for pnl in pnls:
+            scalar.update_trade_history(pnl)
+        batched.update_trade_history_batch(pnls)
+        assert history_state(batched) == history_state(scalar)
+    return batched
+
+
+def test_trade_history_batch_longer_than_window():
+    rm = assert_batch_matches_scalar([[1.0, -1.0, 2.0, 3.0, -0.5, 0.0, 4.0, -2.0, 1.5, 2.5]])
+    assert rm.count == 4
+
+
+def test_trade_history_batch_crosses_throttle_threshold():
+    rm = assert_batch_matches_scalar([[1.0, 1.0], [-1.0, -1.0, -1.0]])
+    assert rm.trading_paused_throttle
+    rm = assert_batch_matches_scalar([[-1.0, -1.0, -1.0, 1.0], [1.0, 1.0]])
+    assert not rm.trading_paused_throttle
+
+
+def test_trade_history_batch_wide_windows():
+    pnls = [(-1.0) ** (i // 3) * (i % 5) for i in range(300)]
+    for throttle_window in (1, 63, 64, 65, 130):
+        assert_batch_matches_scalar([pnls[:7], [], pnls[7:200], pnls[200:]], throttle_window)
@@ -1,34 +1,51 @@
 import os
 import time
-from openai import OpenAI
+from openai import AsyncOpenAI
 import json
 from datetime import datetime
 
+SENTIMENT_CACHE_SIZE = 32  # Distinct headline sets whose sentiment is remembered
+
 class AI_Analyzer:
     def __init__(self):
         try:
-            self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            self.client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
             self.sentiment = "Neutral"
             self.last_analysis_time = 0
             self.cache_duration = 60 * 15 # Cache sentiment for 15 minutes
+            self._sentiment_cache = {}  # tuple(headlines) -> sentiment, oldest first
+            self._load_cached_status()
             print("AI_Analyzer Initialized.")
         except Exception as e:
             print(f"Error initializing OpenAI client: {e}")
             self.client = None
 
+    def _load_cached_status(self):
+        """Reuses the sentiment saved in ai_status.json if it is still fresh, e.g. after a bot restart."""
+        try:
+            with open("ai_status.json", "r") as f:
+                status = json.load(f)
+            analysis_time = datetime.fromisoformat(status["last_updated"]).timestamp()
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        if 0 <= time.time() - analysis_time < self.cache_duration and status.get("sentiment") in ["Bullish", "Bearish", "Neutral"]:
+            self.sentiment = status["sentiment"]
+            self.last_analysis_time = analysis_time
+            print(f"Using cached AI sentiment from {status['last_updated']}: {self.sentiment}")
+
     def get_current_sentiment(self):
         """Returns the cached sentiment."""
         return self.sentiment
 
-    def refresh_sentiment(self):
-        """Fetches news, updates sentiment, and saves status to a file."""
+    async def refresh_sentiment(self):
+        """Fetches news, updates sentiment, and saves status to a file without blocking the event loop."""
         current_time = time.time()
         if (current_time - self.last_analysis_time) < self.cache_duration:
             return
 
         print("AI sentiment cache expired. Requesting new analysis...")
         headlines = self._fetch_market_news()
-        self.sentiment = self._get_sentiment_from_ai(headlines)
+        self.sentiment = await self._get_sentiment_from_ai(headlines)
         self.last_analysis_time = current_time
         print(f"--- New AI Sentiment: {self.sentiment} ---")
 
@@ -38,8 +55,10 @@ class AI_Analyzer:
             "last_updated": datetime.now().isoformat()
         }
         try:
-            with open("ai_status.json", "w") as f:
+            # Replace the file in one step so the dashboard never reads a partial write
+            with open("ai_status.json.tmp", "w") as f:
                 json.dump(status, f, indent=4)
+            os.replace("ai_status.json.tmp", "ai_status.json")
         except Exception as e:
             print(f"Error saving AI status file: {e}")
 
@@ -51,12 +70,15 @@ class AI_Analyzer:
             "Regulatory concerns in Asia cast a shadow over short-term crypto market.",
         ]
 
-    def _get_sentiment_from_ai(self, headlines):
+    async def _get_sentiment_from_ai(self, headlines):
         """Analyzes headlines using the OpenAI API."""
         if not self.client: return "Neutral"
+        key = tuple(headlines)
+        if key in self._sentiment_cache:
+            return self._sentiment_cache[key]
         formatted_headlines = "\n- ".join(headlines)
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are a financial analyst. Analyze the sentiment of crypto news headlines. Respond with only a single word: Bullish, Bearish, or Neutral."},
@@ -65,7 +87,12 @@ class AI_Analyzer:
                 temperature=0, max_tokens=5
             )
             sentiment = response.choices[0].message.content.strip()
-            return sentiment if sentiment in ["Bullish", "Bearish", "Neutral"] else "Neutral"
+            sentiment = sentiment if sentiment in ["Bullish", "Bearish", "Neutral"] else "Neutral"
         except Exception as e:
             print(f"OpenAI API error: {e}")
-            return "Neutral"
+            return "Neutral"  # Not cached, so the next refresh retries
+
+        if len(self._sentiment_cache) >= SENTIMENT_CACHE_SIZE:
+            del self._sentiment_cache[next(iter(self._sentiment_cache))]
+        self._sentiment_cache[key] = sentiment
+        return sentiment
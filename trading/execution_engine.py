@@ -24,10 +24,10 @@ class ExecutionEngine:
         if not decision: return
 
         # --- Handle Exits First ---
-        if decision["action"] == "exit":
+        if decision.action == "exit":
             if not getattr(self.strat, 'pos', None): return
             
-            exit_price = getattr(self.strat, 'latest_ask', decision.get('price'))
+            exit_price = getattr(self.strat, 'latest_ask', decision.price)
             if exit_price is None: return
 
             entry = float(self.strat.pos.get("entry", 0) or 0)
@@ -38,17 +38,17 @@ class ExecutionEngine:
             pnl = (exit_price - entry) * qty
             self.budget += pnl
             self.risk_manager.update_trade_history(pnl)
-            self.log.info(f"[PAPER] EXIT {self.strat.pos['side']} @ {exit_price} ({decision.get('reason','')}) | PnL={pnl:.2f} | New Budget=${self.budget:,.2f}")
-            self.log_trade(self.cfg.symbol_ccxt, "EXIT", self.strat.pos['side'], exit_price, qty, reason=decision.get('reason',''), pnl_usdt=pnl)
+            self.log.info(f"[PAPER] EXIT {self.strat.pos['side']} @ {exit_price} ({decision.reason}) | PnL={pnl:.2f} | New Budget=${self.budget:,.2f}")
+            self.log_trade(self.cfg.symbol_ccxt, "EXIT", self.strat.pos['side'], exit_price, qty, reason=decision.reason, pnl_usdt=pnl)
             self.strat.pos = None
             return
 
         # --- Handle Entries ---
-        if decision["action"] == "enter_long":
+        if decision.action == "enter_long":
             if getattr(self.strat, 'pos', None): return
             
             # Estimate notional value
-            price = getattr(self.strat, 'latest_bid', decision.get('price'))
+            price = getattr(self.strat, 'latest_bid', decision.price)
             if price is None: return
             qty = self._order_size(price)
             notional_value = qty * price
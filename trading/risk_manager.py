@@ -1,52 +1,145 @@
 # In trading/risk_manager.py
-from collections import deque
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+# Bits of RiskManager._paused, one per reason trading can be paused
+PAUSED_DRAWDOWN = 1
+PAUSED_THROTTLE = 2
+
+@dataclass(slots=True)
+class Signal:
+    """A strategy's trade decision, as passed to RiskManager.approve_trade and ExecutionEngine.act."""
+    action: str  # 'enter_long' or 'exit'
+    price: float | None = None
+    reason: str = ''
 
 class RiskManager:
+    # Fixed attribute layout: no per-instance __dict__, and attribute reads are slot lookups
+    __slots__ = ('cfg', 'ai_analyzer', 'starting_budget', '_paused',
+                 'W', 'mask', 'count', '_window_bits', '_dd_pct', '_min_budget', '_throttle_threshold_count',
+                 '_sent_cache', '_sent_ttl', '_lock', 'log')
+
     def __init__(self, cfg, ai_analyzer):
         self.cfg = cfg
         self.ai_analyzer = ai_analyzer # NEW: Store reference to the AI analyzer
         # ... (rest of __init__ is the same)
         self.starting_budget = cfg.total_budget_usdt
-        self.trading_paused_drawdown = False
-        self.trade_history = deque(maxlen=cfg.throttle_window)
-        self.trading_paused_throttle = False
-        print("RiskManager Initialized with AI Sentiment Filter.")
+        # Pause reasons packed into one int: approve_trade reads it in a single load, and every
+        # change is one rebind made under the lock, so a reader never sees half a transition
+        self._paused = 0
+        # Last throttle_window trade results as a bitmask (bit 0 = newest, 1 = win) and how many it holds.
+        # Python ints grow as needed, so any window size works, including windows of 64 trades or more
+        self.W = cfg.throttle_window
+        self.mask = 0
+        self.count = 0
+        self._window_bits = (1 << self.W) - 1
+        # Thresholds as plain compares: the budget floor, and the fewest wins in a full window that
+        # keep the win rate at or above throttle_threshold_pct (found with the same division as before)
+        self._dd_pct = cfg.daily_drawdown_pct
+        self._min_budget = self.starting_budget * (1.0 - self._dd_pct)
+        self._throttle_threshold_count = next(
+            (k for k in range(self.W + 1) if k / max(self.W, 1) >= cfg.throttle_threshold_pct), self.W + 1)
+        self._sent_cache = (float("-inf"), None)  # (monotonic time read, sentiment)
+        self._sent_ttl = cfg.sentiment_ttl_sec
+        # Guards the window and the pause transitions; flags are read without it, sentiment is fetched outside it
+        self._lock = threading.Lock()
+        self.log = logging.getLogger("momo")
+        self.log.info("RiskManager Initialized with AI Sentiment Filter.")
+
+    @property
+    def trading_paused_drawdown(self):
+        return bool(self._paused & PAUSED_DRAWDOWN)
+
+    @property
+    def trading_paused_throttle(self):
+        return bool(self._paused & PAUSED_THROTTLE)
 
     def approve_trade(self, signal, current_budget):
-        """Checks signal against all risk rules, including AI sentiment."""
-        current_sentiment = self.ai_analyzer.get_current_sentiment()
-        self.log.debug(f"RiskManager checking signal. AI Sentiment is '{current_sentiment}'.")
+        """Checks signal against all risk rules, including AI sentiment.
 
-        if signal.get('action') == 'enter_long' and current_sentiment == "Bearish":
-            self.log.warning(f"Trade REJECTED by RiskManager: AI sentiment is Bearish.")
+        The local flags and budget checks run first, so a paused manager never asks for sentiment.
+        """
+        paused = self._paused
+        if paused:
+            # --- NEW: Check 2: Dynamic Throttling (the bit is kept current by update_trade_history) ---
+            if paused == PAUSED_THROTTLE:
+                self.log.warning("Trade REJECTED: Throttled due to low win rate.")
             return False
 
-        drawdown_pct = (current_budget - self.starting_budget) / self.starting_budget
-        if drawdown_pct < -self.cfg.daily_drawdown_pct:
-            self.trading_paused_drawdown = True
-            print(f"!!! CRITICAL: DAILY DRAWDOWN LIMIT OF {self.cfg.daily_drawdown_pct:.1%} HIT !!!")
-            return False
-        
-        # --- NEW: Check 2: Dynamic Throttling ---
-        if self.trading_paused_throttle:
-            print("Trade REJECTED: Throttled due to low win rate.")
+        if current_budget < self._min_budget:
+            with self._lock:
+                newly_paused = not self._paused & PAUSED_DRAWDOWN
+                self._paused |= PAUSED_DRAWDOWN
+            if newly_paused:
+                self.log.critical("!!! DAILY DRAWDOWN LIMIT OF %.1f%% HIT !!!", self._dd_pct * 100)
             return False
 
-        if len(self.trade_history) == self.cfg.throttle_window:
-            win_rate = sum(self.trade_history) / len(self.trade_history)
-            if win_rate < self.cfg.throttle_threshold_pct:
-                self.trading_paused_throttle = True
-                print(f"!!! WARNING: WIN RATE ({win_rate:.1%}) BELOW THRESHOLD. TRADING PAUSED. !!!")
+        if signal.action == 'enter_long':
+            current_sentiment = self._sentiment()
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug("RiskManager checking signal. AI Sentiment is '%s'.", current_sentiment)
+            if current_sentiment == "Bearish":
+                self.log.warning("Trade REJECTED by RiskManager: AI sentiment is Bearish.")
                 return False
         
         return True
-        
+
+    def _sentiment(self):
+        """Returns the AI sentiment, re-reading it from the analyzer at most once per TTL."""
+        now = time.monotonic()
+        read_at, sentiment = self._sent_cache
+        if now - read_at > self._sent_ttl:
+            sentiment = self.ai_analyzer.get_current_sentiment()
+            self._sent_cache = (now, sentiment)
+        return sentiment
+
+    def _push(self, win_bits, n=1):
+        """Shifts n trade results into the window (newest in bit 0); the oldest bits fall off once it is full.
+
+        Insert and evict are both O(1) here because the window's aggregate, the win count, is a sum:
+        dropping the oldest bit removes its contribution exactly. A non-invertible rolling aggregate
+        (max drawdown, min equity) cannot be undone that way and would need a two-stack sliding-window
+        aggregator such as DABA-Lite to stay O(1) per trade.
+        """
+        self.mask = ((self.mask << n) | win_bits) & self._window_bits
+        self.count = min(self.count + n, self.W)
+
     def update_trade_history(self, pnl):
-        """Adds the result of a closed trade to the history for throttling checks."""
-        self.trade_history.append(1 if pnl > 0 else 0)
-        # If performance improves, un-pause trading
-        if self.trading_paused_throttle:
-             win_rate = sum(self.trade_history) / len(self.trade_history)
-             if win_rate >= self.cfg.throttle_threshold_pct:
-                 self.trading_paused_throttle = False
-                 print("--- PERFORMANCE IMPROVED. DYNAMIC THROTTLE LIFTED. ---")
+        """Adds the result of a closed trade to the history and pauses or resumes trading on its win rate."""
+        self._record(1 if pnl > 0 else 0, 1)
+
+    def update_trade_history_batch(self, pnls):
+        """Adds the results of several closed trades, oldest first, and re-checks the win rate once.
+
+        The pause only depends on the final window, so the outcome matches calling update_trade_history
+        for each pnl in turn; only the intermediate pause/lift log lines are skipped.
+        """
+        wins = np.asarray(pnls, dtype=np.float64) > 0
+        if not wins.size:
+            return
+        # Newest result in bit 0: reverse, pack little-endian and read the bytes as one int
+        packed = int.from_bytes(np.packbits(wins[::-1], bitorder='little').tobytes(), 'little')
+        self._record(packed, wins.size)
+
+    def _record(self, win_bits, n):
+        with self._lock:
+            self._push(win_bits, n)
+            count = self.count
+            if count < self.W:
+                return
+            wins, threshold, paused = self.mask.bit_count(), self._throttle_threshold_count, self._paused & PAUSED_THROTTLE
+            if not paused and wins < threshold:
+                self._paused |= PAUSED_THROTTLE
+            # If performance improves, un-pause trading; a drawdown pause stays set
+            elif paused and wins >= threshold:
+                self._paused &= ~PAUSED_THROTTLE
+            else:
+                return
+        if not paused:  # The transition above paused trading
+            self.log.warning("!!! WIN RATE (%.1f%%) BELOW THRESHOLD. TRADING PAUSED. !!!", wins / count * 100)
+        else:
+            self.log.info("--- PERFORMANCE IMPROVED. DYNAMIC THROTTLE LIFTED. ---")